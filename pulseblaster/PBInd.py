@@ -1,12 +1,62 @@
 import pulseblaster.spinapi as spincore_spinapi
 import numpy as np
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _min_streak_scan_loop(state):
+    """
+    Scans a packed state array and returns (min_streak, min_streak_index): the length in
+    samples of the shortest run of equal flag words and the sample index where it starts.
+    """
+    n = len(state)
+    min_streak = n
+    min_streak_index = 0
+    current_streak = 1
+    streak_start = 0
+    for i in range(1, n):
+        if state[i] == state[i-1]:
+            current_streak += 1
+        else:
+            if current_streak < min_streak:
+                min_streak = current_streak
+                min_streak_index = streak_start
+            streak_start = i
+            current_streak = 1
+    if current_streak < min_streak:
+        min_streak = current_streak
+        min_streak_index = streak_start
+    return min_streak, min_streak_index
+
+
+if njit is not None:
+    # compile the single-pass scan to a C-speed kernel
+    _min_streak_scan = njit(cache=True)(_min_streak_scan_loop)
+else:
+    def _min_streak_scan(state):
+        """
+        Vectorized equivalent of _min_streak_scan_loop: run lengths come from one
+        np.diff over the change boundaries, so no Python loop over samples remains.
+        """
+        edges = np.flatnonzero(state[1:] != state[:-1]) + 1
+        bounds = np.empty(len(edges) + 2, dtype=np.intp)
+        bounds[0] = 0
+        bounds[1:-1] = edges
+        bounds[-1] = len(state)
+        runs = np.diff(bounds)
+        shortest = int(np.argmin(runs))  # ties resolve to the earliest run, as in the scan
+        return int(runs[shortest]), int(bounds[shortest])
+
+
 class PBInd:
     """
     PBInd is a client of the SpinCore PulseBlaster API that allows the user
     to program the pins of the PulseBlaster (PB) independently of one another in python.
-    Features validation for sequences based on the provided PulseBlaster specifications.    
-    
+    Features validation for sequences based on the provided PulseBlaster specifications.
+
     :param pins: List of pin numbers to be programmed on the PB (0-23 are valid)
     :param DEBUG_MODE: Flag to enable debug mode (prints out PB instructions)
     :param on_time: Cycle duration (ns)
@@ -31,15 +81,124 @@ class PBInd:
         self._res  = resolution
         self._minimum_pulse = minimum_pulse
         self._smps = round(self._on_time/self._res) # total length of instruction in samples (before looping)
-        self._output_chs = ['0'*self._smps]*(len(self._pins)) # 'bitset' representation of output
-        self.instructions = "" # string representation of commands issued to Pulseblaster
+        self._res_ns = self._res * spincore_spinapi.ns # duration of one sample in spinapi time units
+        # packed representation of the output: one uint32 flag word per sample,
+        # where bit p holds the state of pin p
+        self._state = np.zeros(self._smps, dtype=np.uint32)
+        self._pin_bit = {p: np.uint32(1 << p) for p in self._pins} # pin number -> flag-word mask
+        self._state_version = 0 # incremented on every state edit
+        self._validated_version = -1 # state version last validated by program()
+        self._cached_runs = None # (flags, durations) compiled from the current state
+        self._instr_lines = [] # accumulates the string representation of commands issued to Pulseblaster
         self._auto_stop = auto_stop # if turned off, allows the client to program after a call to PBInd.program()
+        # precomputed guard: program() drives pb_start/stop_programming itself only
+        # when auto_stop is enabled and we are not in debug mode
+        self._auto_program = bool(auto_stop) and not bool(DEBUG_MODE)
         self.spinapi = spincore_spinapi
 
+    @classmethod
+    def from_intervals(cls,
+                pins,
+                intervals,
+                DEBUG_MODE = 0,
+                on_time = None,
+                resolution = 10,
+                minimum_pulse = 50,
+                auto_stop = 0):
+        """
+        Builds a PBInd directly from a list of on-intervals without materializing the
+        per-sample state array, so the cycle duration no longer bounds memory use.
+        The instruction plan is derived by sweeping the sorted interval edges;
+        overlapping intervals on the same pin are merged. Instances built this way
+        are ready to program() but do not support further on()/off() edits.
+
+        :param pins: List of pin numbers to be programmed on the PB (0-23 are valid)
+        :param intervals: List of (pin, start, length) tuples (ns) describing when pins are high
+        :param DEBUG_MODE: Flag to enable debug mode (prints out PB instructions)
+        :param on_time: Cycle duration (ns); defaults to the end of the last interval
+        :param resolution: Granularity of pulse increments (see your PB specs)
+        :param minimum_pulse: Minimum pulse width (see your PB specs)
+        :param auto_stop: Flag to automatically stop the PulseBlaster after a sequence (1 for enabled, 0 for disabled).
+        :raises ValueError: A start or length is not a multiple of the pulse resolution.
+        :raises IndexError: An interval falls outside of the valid cycle range.
+        :raises Exception: Resulting instructions violate the minimum pulse length.
+        """
+        inst = cls(pins, DEBUG_MODE=DEBUG_MODE, on_time=0, resolution=resolution,
+                   minimum_pulse=minimum_pulse, auto_stop=auto_stop)
+
+        # per-pin depth deltas at each edge sample, keyed by sample index
+        deltas = {}
+        last_end = 0
+        for pin, start, length in intervals:
+            inst._get_pin_bit(pin)  # raises on an invalid pin
+            if start % resolution != 0:
+                raise ValueError(f"Start time is not a multiple of 10ns: {start}ns")
+            if length % resolution != 0:
+                raise ValueError(f"Length is not a multiple of 10ns: {length}ns")
+            start_smp = round(start / resolution)
+            stop_smp = start_smp + round(length / resolution)  # exclusive
+            if start_smp < 0:
+                raise IndexError(f"Invalid start sample time: {start_smp}")
+            if stop_smp > last_end:
+                last_end = stop_smp
+            if stop_smp > start_smp:
+                deltas.setdefault(start_smp, {}).setdefault(pin, 0)
+                deltas[start_smp][pin] += 1
+                deltas.setdefault(stop_smp, {}).setdefault(pin, 0)
+                deltas[stop_smp][pin] -= 1
+
+        if on_time is None:
+            on_time = last_end * resolution
+        elif on_time % 10 != 0:
+            raise ValueError('total instruction time is not a multiple of 10ns: ' + str(on_time) + 'ns')
+        total_smps = round(on_time / resolution)
+        if last_end > total_smps:
+            raise IndexError(f"Invalid stop sample time: {last_end}")
+        inst._on_time = on_time
+        inst._smps = total_smps
+
+        # sweep the edges left to right, closing a run whenever the flag word changes
+        depth = {}
+        flag = 0
+        flags = []
+        durations = []
+        prev_t = 0
+        for t in sorted(deltas):
+            new_flag = flag
+            for pin, delta in deltas[t].items():
+                depth[pin] = depth.get(pin, 0) + delta
+                if depth[pin] > 0:
+                    new_flag |= 1 << pin
+                else:
+                    new_flag &= ~(1 << pin)
+            if new_flag != flag:
+                if t > prev_t:
+                    flags.append(flag)
+                    durations.append(t - prev_t)
+                    prev_t = t
+                flag = new_flag
+        if total_smps > prev_t:
+            flags.append(flag)
+            durations.append(total_smps - prev_t)
+
+        # same timing constraint _validate_pulse_instructions enforces, checked
+        # against the run list instead of a sample raster
+        min_instruction_span = int(minimum_pulse / resolution)
+        run_start = 0
+        for duration in durations:
+            if duration < min_instruction_span:
+                raise Exception(f'Instruction duration {duration * resolution}ns shorter than required '
+                                f'{minimum_pulse}ns starting at time {run_start * resolution}ns (index {run_start}).')
+            run_start += duration
+
+        inst._cached_runs = (flags, durations)
+        inst._validated_version = inst._state_version  # the run list above is already validated
+        return inst
+
     def on(self, pin, start, length):
         """
         Sets a selected pin to high voltage.
-        
+
         :param pin (int): Selected pulseblaster pin
         :param start (int): Start time (ns) relative to the start of the cycle
         :param length (int): Duration (ns)
@@ -51,7 +210,7 @@ class PBInd:
     def off(self, pin, start, length):
         """
         Sets a selected pin to low voltage.
-        
+
         :param pin (int): Selected pulseblaster pin
         :param start (int): Start time (ns) relative to the start of the cycle
         :param length (int): Duration (ns)
@@ -60,38 +219,46 @@ class PBInd:
         """
         self._set(pin, start, length, 0)
 
+    @property
+    def instructions(self):
+        """String representation of the commands issued to the Pulseblaster"""
+        return "".join(self._instr_lines)
+
     def make_clock(self, pin, period):
         """
         Configures a selected pin to output a 50% duty-cycle clock with the given period.
-        
+
         :param pin (int): Pin to be used as the clock output.
         :param period (int): Clock period duration (ns).
-        :raises ValueError: If the clock period is shorter than twice the minimum pulse length, 
+        :raises ValueError: If the clock period is shorter than twice the minimum pulse length,
              or not a multiple of twice the resolution.
         """
         # Ensure period is long enough
         if period / 2 < self._minimum_pulse:
             raise ValueError(f'Requested clock period ({period} ns) is too short: less than {2 * self._minimum_pulse} ns')
-        
+
         # Ensure period is a multiple of resolution*2
         if period % (self._res * 2) != 0:
             raise ValueError(f'Requested clock period ({period} ns) is not a multiple of ({self._res * 2} ns)')
 
-        ticks = 0  # count the number of actual ticks that are programmed
-        cursor = 0
-        # Sweep across chs and add ticks
-        while cursor + period <= self._on_time:
-            self.on(pin, cursor, period / 2)
-            cursor = cursor + period / 2
-            self.off(pin, cursor, period / 2)
-            cursor = cursor + period / 2
-            ticks = ticks + 1
+        mask = self._get_pin_bit(pin)
+
+        half_smps = round(period / (2 * self._res))  # samples per half-period
+        ticks = self._smps // (2 * half_smps)  # number of full periods that fit in the cycle
+        full_smps = ticks * 2 * half_smps
+
+        # Build the whole pulse train in one strided pass: high for the first
+        # half of every period, low for the second
+        pattern = ((np.arange(full_smps) // half_smps) & 1) == 0
+        self._state[:full_smps] &= ~mask
+        self._state[:full_smps] |= pattern * mask
+        self._state_version += 1
 
 
     def program(self, loops):
         """
         Summary of the function or class.
-        
+
         :param loops: Number of cycle repititions
         :returns: Description of the return value.
         :raises ExceptionType: Description of the exception raised.
@@ -99,18 +266,22 @@ class PBInd:
         if loops < 1:
             raise Exception('number of loops must be positive integer')
 
-        if not self._DEBUG_MODE & self._auto_stop:
-            self.spinapi.pb_start_programming('PULSE_PROGRAM')
+        if self._auto_program:
+            self.spinapi.pb_start_programming(self.spinapi.PULSE_PROGRAM)
 
-        # the client did not request delays, so the matrix is unchanged
-        self._validate_pulse_instructions(self._output_chs)
-        self._write_instruction(self._output_chs, loops)
+        # skip re-validation when the state is untouched since the last program()
+        # (e.g. re-triggering the same sequence with a different loop count)
+        if self._validated_version != self._state_version:
+            self._validate_pulse_instructions(self._state)
+            self._cached_runs = None
+            self._validated_version = self._state_version
+        self._write_instruction(self._state, loops)
 
         if self._DEBUG_MODE:
-            self.instructions = self.instructions + "pb_inst_pbonly(0, 'STOP', 0, " + str(2*self._res) + ")\n"
+            self._instr_lines.append("pb_inst_pbonly(0, 'STOP', 0, " + str(2*self._res) + ")\n")
 
-        if (not self._DEBUG_MODE) & self._auto_stop:
-            self.spinapi.pb_inst_pbonly(0, 'STOP', 0, 2 * self._res)
+        if self._auto_program:
+            self.spinapi.pb_inst_pbonly(0, self.spinapi.Inst.STOP, 0, 2 * self._res_ns)
             self.spinapi.pb_stop_programming()
 
         self.print_instructions()
@@ -123,74 +294,82 @@ class PBInd:
             print(self.instructions)
 
     ## PRIVATE
-    def _write_instruction(self, actual_chs, loops):
-        """Produces the instructions used to program the PulseBlaster from the CHS matrix"""
-        if len(actual_chs)==0:
+    def _write_instruction(self, state, loops):
+        """Produces the instructions used to program the PulseBlaster from the packed state array"""
+        # Given a state array, program a sequence of Pulseblaster instructions.
+        # The 'command' can be Inst.CONTINUE or Inst.LOOP
+        # hoist the spinapi attribute chains out of the emit loop
+        Inst = self.spinapi.Inst
+        pb_inst = self.spinapi.pb_inst_pbonly
+        res = self._res  # durations stay in integer samples internally;
+        res_ns = self._res_ns  # conversion to spinapi time happens once, at the FFI call
+
+        # plan the whole instruction list up front so the loop below only
+        # has to cross the spinapi boundary; the plan is reused until the
+        # state is edited again
+        if self._cached_runs is None:
+            self._cached_runs = self._compile_runs(state)
+        flags, durations = self._cached_runs
+        if not flags:
             return
-        # Given a chs matrix, program a sequence of Pulseblaster instructions. 
-        # The 'command' can be self.spinapi.Inst.CONTINUE or self.spinapi.Inst.LOOP
-        prev_state_d = 0  # index of 'prev_state'
-        prev_state =  self._get_state(prev_state_d, actual_chs, len(self._pins)) # vertical slice of states as bitset
 
-        actual_smps = len(actual_chs[0])
+        if len(flags) == 1:
+            # homogeneous state: the whole cycle is a single instruction, so
+            # there is no loop body to frame. Branch back to it for infinite
+            # repetition, otherwise fold the repetitions into its duration
+            hex_flag = flags[0]
+            dur_smps = durations[0]
+            if loops == float('inf'):
+                command = Inst.BRANCH
+            else:
+                command = Inst.CONTINUE
+                dur_smps = dur_smps * loops
+            if not self._DEBUG_MODE:
+                pb_inst(hex_flag, command, 0, dur_smps * res_ns)
+            else:
+                self._instr_lines.append("pb_inst_pbonly(" + str(hex_flag) + "," + str(command) + ",0," + str(dur_smps * res) + ")\n")
+            return
 
-        cur_command = self.spinapi.Inst.CONTINUE  # the next instruction
-        last_command = self.spinapi.Inst.CONTINUE
+        cur_command = Inst.CONTINUE  # the next instruction
+        last_command = Inst.CONTINUE
         if loops == float('inf'):
             # in this case we want an infinite loop
-            last_command = self.spinapi.Inst.BRANCH
+            last_command = Inst.BRANCH
             loops=0
         elif loops > 1:
             # if loops > 1, then the first and last commands will be loop commands
-            cur_command = self.spinapi.Inst.LOOP
-            last_command = self.spinapi.Inst.END_LOOP
+            cur_command = Inst.LOOP
+            last_command = Inst.END_LOOP
 
         first_inst = float('inf')  # this will eventually change to the first instruction ID
+        loops_arg = int(loops)  # scalar conversion hoisted out of the emit loop
+
+        for hex_flag, dur_smps in zip(flags[:-1], durations[:-1]):
+            # every run but the last becomes a new instruction to the PB
+            if not self._DEBUG_MODE:
+                first_inst = min(pb_inst(hex_flag, cur_command, loops_arg, dur_smps * res_ns), first_inst)  # we want inst to be the lowest instruction ID
+            else:
+                first_inst = 0
 
-        for d in range(1,actual_smps):
-            current_state = self._get_state(d, actual_chs, len(self._pins))
             if self._DEBUG_MODE:
-                print(current_state)
-            compare = current_state == prev_state
-            if not compare:
-                # at least one channel changed state, issue new instruction to PB
-                hex_flag = self._hex_flag(prev_state)
-                duration = (d - prev_state_d) * self._res
-                if not self._DEBUG_MODE:
-                    first_inst = min(self.spinapi.pb_inst_pbonly(hex_flag, cur_command, int(loops), duration * self.spinapi.ns), first_inst)  # we want inst to be the lowest instruction ID
-                else:
-                    first_inst = 0
-
-                if self._DEBUG_MODE:
-                    self.instructions = self.instructions + "pb_inst_pbonly(" + str(hex_flag) + "," + str(cur_command) + "," + str(loops) + "," + str(duration * self.spinapi.ns) + ")\n"
-
-                cur_command = self.spinapi.Inst.CONTINUE  # even if loops > 1, the next commands will all be CONTINUE commands (until last END_LOOP command)
-                prev_state = current_state
-                prev_state_d = d
-
-        # we have reached the end of the chs matrix. Now issue the last instruction
-        hex_flag = self._hex_flag(prev_state)
-        duration = (actual_smps - prev_state_d) * self._res  # the plus one is needed otherwise there is an off by one error
-        if (first_inst == float('inf')) & (loops > 1):
-            # in this case, the matrix was homogeneous and no
-            # instructions were issued in the loop. Therefore the last
-            # command CANNOT be an END_LOOP (there was no 'begin loop').
-            # Simply change it to a CONTINUE command
-            last_command = self.spinapi.Inst.CONTINUE
-            duration = duration * loops
+                self._instr_lines.append("pb_inst_pbonly(" + str(hex_flag) + "," + str(cur_command) + "," + str(loops) + "," + str(dur_smps * res) + ")\n")
+
+            cur_command = Inst.CONTINUE  # even if loops > 1, the next commands will all be CONTINUE commands (until last END_LOOP command)
+
+        # we have reached the end of the state array. Now issue the last instruction
+        hex_flag = flags[-1]
+        dur_smps = durations[-1]
 
         if not self._DEBUG_MODE:
-            if first_inst == float('inf'):
-                first_inst = 0
-            self.spinapi.pb_inst_pbonly(hex_flag, last_command, first_inst, duration * self.spinapi.ns)  # this instruction could be an END_LOOP command
+            pb_inst(hex_flag, last_command, first_inst, dur_smps * res_ns)  # this instruction could be an END_LOOP command
 
         if self._DEBUG_MODE:
-            self.instructions = self.instructions + "pb_inst_pbonly(" + str(hex_flag)+ "," + str(last_command) +","+ str(first_inst) +","+str(duration) +")\n"
+            self._instr_lines.append("pb_inst_pbonly(" + str(hex_flag)+ "," + str(last_command) +","+ str(first_inst) +","+str(dur_smps * res) +")\n")
 
     def _set(self, pin, start, len, val):
         """
         Sets a selected pin to a specifified value (high/low).
-        
+
         :param pin (int): Selected pulseblaster pin
         :param start (int): Start time (ns) relative to the start of the cycle
         :param length (int): Duration (ns)
@@ -211,98 +390,86 @@ class PBInd:
             raise IndexError(f"Invalid stop sample time: {stop_smp}")
 
         if stop_smp >= start_smp:
-            ch = self._get_ch(pin)
-            self._output_chs[ch] = self._output_chs[ch][min(start_smp,0):start_smp] + str(val)*(stop_smp-start_smp+1) + self._output_chs[ch][stop_smp:-1]
+            mask = self._get_pin_bit(pin)
+            if val:
+                self._state[start_smp:stop_smp+1] |= mask
+            else:
+                self._state[start_smp:stop_smp+1] &= ~mask
+            self._state_version += 1
             # TODO: possibly add rounding feature to improve downsample
 
-    def _get_ch(self, pin):
-        index = -1
-        for d in range(len(self._pins)):
-            if self._pins[d] == pin:
-                index = d
-                break
+    def _compile_runs(self, state):
+        """
+        Collapses the packed state array into parallel lists describing one
+        PulseBlaster instruction per run of equal flag words.
 
-        if index == -1:
+        :param state: Packed state array with one flag word per time step
+        :returns: Tuple (flags, durations) of equal-length lists: the flag word of each
+                  run and its duration in samples
+        """
+        if len(state) == 0:
+            return [], []
+        # sample indices where at least one channel changes state; only these
+        # (typically a handful) need a Pulseblaster instruction boundary
+        edges = np.flatnonzero(state[1:] != state[:-1]) + 1
+        bounds = np.empty(len(edges) + 2, dtype=np.intp)
+        bounds[0] = 0
+        bounds[1:-1] = edges
+        bounds[-1] = len(state)
+        flags = state[bounds[:-1]].tolist()
+        durations = np.diff(bounds).tolist()
+        return flags, durations
+
+    def _get_pin_bit(self, pin):
+        try:
+            return self._pin_bit[pin]
+        except KeyError:
             raise Exception('invalid pin requested: ' + str(pin))
 
-        return index
-
-    def _hex_flag(self, state):
-        hex_flag = 0
-        for d in range(len(state)):
-            if state[d] == '1':
-                # this pin is on, add to flag
-                # TODO: somewhere, clarify self._pins(d) vs 2^self._pins(d)
-                hex_flag = hex_flag|2**(self._pins[d])
-        return hex_flag
+    def _changed_chs(self, state_a, state_b):
+        """Returns the channel indices whose pins differ between two packed state words"""
+        diff = int(state_a) ^ int(state_b)
+        return np.flatnonzero((diff >> np.asarray(self._pins)) & 1)
 
-    def _get_state(self, state_index, state_array, num_elements):
-            stateslice=""
-            for i in range(num_elements):
-                stateslice = stateslice + state_array[i][state_index]
-
-            return stateslice
-
-    def _validate_pulse_instructions(self, chs_matrix):
+    def _validate_pulse_instructions(self, state):
         """
         Validates that all instructions respect PulseBlaster timing constraints
-        
-        :param chs_matrix: 2D matrix representing pulse instructions, where each row corresponds to a channel and each column
-                        corresponds to a time step. The values in the matrix indicate the state (high or low) of the channels
-                        at each time step
-        :raises Exception: Matrix value changes more than once in a rolling period equal to the minimum pulse length
+
+        :param state: Packed state array with one flag word per time step, where bit p holds
+                        the state (high or low) of pin p at that time step
+        :raises Exception: State changes more than once in a rolling period equal to the minimum pulse length
         """
         min_instruction_span = int(self._minimum_pulse / self._res)  # Required minimum span in columns
 
-        chs_matrix = np.array([list(row) for row in chs_matrix])
-    
-        current_streak = 1
-        streak_start = 0
-        change_indices = []
-        min_streak = float('inf')
-        min_streak_index = 0
-        problem_channels_start = []  # Will store which channels started the shortest instruction
-        problem_channels_end = []  # Will store which channels ended the shortest instruction
-    
-        # Compare entire columns
-        for i in range(1, chs_matrix.shape[1]):
-            if np.array_equal(chs_matrix[:, i], chs_matrix[:, i-1]):
-                current_streak += 1
-            else:
-                # Column changed, check if previous streak was long enough
-                if current_streak < min_streak:
-                    min_streak = current_streak
-                    min_streak_index = streak_start
-                    # Find which channels changing at this change interface and prior interface
-                    if (streak_start > 0):
-                        problem_channels_start = np.where(chs_matrix[:, streak_start] != chs_matrix[:, streak_start-1])[0]
-                    else:
-                        problem_channels_start = np.array([]) # All channels change at start
-                    problem_channels_end = np.where(chs_matrix[:, i] != chs_matrix[:, i-1])[0]
-            
-                change_indices.append(i)
-                streak_start = i
-                current_streak = 1
-    
-        # Check final streak
-        if current_streak < min_streak:
-            min_streak = current_streak
-            min_streak_index = streak_start
-            if streak_start > 0:
-                problem_channels_start = np.where(chs_matrix[:, streak_start] != chs_matrix[:, streak_start-1])[0]
-            else:
-                problem_channels_start = np.array([])
+        # Single pass over the flag words (JIT compiled when numba is installed);
+        # the happy path needs nothing beyond the shortest run and its location
+        min_streak, min_streak_index = _min_streak_scan(state)
+
+        if min_streak >= min_instruction_span:
+            return
+
+        # Minimum streak is too short: reconstruct the details for the exception
+        change_indices = (np.flatnonzero(state[1:] != state[:-1]) + 1).tolist()
+
+        if min_streak_index > 0:
+            # Channels that started the shortest instruction
+            problem_channels_start = self._changed_chs(state[min_streak_index], state[min_streak_index-1])
+        else:
+            problem_channels_start = np.array([]) # All channels change at start
+        streak_end = min_streak_index + min_streak
+        if streak_end < len(state):
+            # Channels that ended the shortest instruction
+            problem_channels_end = self._changed_chs(state[streak_end], state[streak_end-1])
+        else:
             problem_channels_end = np.array([])
-    
-        # If minimum streak is too short, raise exception
-        if min_streak < min_instruction_span:
-            start_channels_str = "initial state" if len(problem_channels_start) == 0 else problem_channels_start.tolist()
-            end_channels_str = "final state" if len(problem_channels_end) == 0 else problem_channels_end.tolist()
-        
-            error_msg = (f'Instruction duration {min_streak * self._res}ns shorter than required '
-                        f'{self._minimum_pulse}ns starting at time {min_streak_index * self._res}ns (index {min_streak_index}). '
-                        f'Instructions changed at indices: {change_indices}. '
-                        f'Channels that changed at instruction\'s start: {start_channels_str}. '
-                        f'Channels that changed at instruction\'s end: {end_channels_str}.')
-            
-            raise Exception(error_msg)
+
+        start_channels_str = "initial state" if len(problem_channels_start) == 0 else problem_channels_start.tolist()
+        end_channels_str = "final state" if len(problem_channels_end) == 0 else problem_channels_end.tolist()
+
+        error_msg = (f'Instruction duration {min_streak * self._res}ns shorter than required '
+                    f'{self._minimum_pulse}ns starting at time {min_streak_index * self._res}ns (index {min_streak_index}). '
+                    f'Instructions changed at indices: {change_indices}. '
+                    f'Channels that changed at instruction\'s start: {start_channels_str}. '
+                    f'Channels that changed at instruction\'s end: {end_channels_str}.')
+
+        raise Exception(error_msg)
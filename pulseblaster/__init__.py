@@ -1,2 +1,10 @@
-from importlib.metadata import version
-__version__ = version(__package__)
+def __getattr__(name):
+    # resolve the version lazily so importing the package does not pay the
+    # importlib.metadata lookup unless __version__ is actually read
+    if name == "__version__":
+        from importlib.metadata import version
+        # cache the result so repeated reads skip the metadata scan;
+        # module __getattr__ is only consulted when the lookup misses
+        globals()["__version__"] = version(__package__)
+        return globals()["__version__"]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")